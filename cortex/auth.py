@@ -13,9 +13,10 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+
 from typing import Dict
 from .serviceconnector import _Client
-from .utils import get_logger, generate_token
+from .utils import get_logger, cached_token
 
 log = get_logger(__name__)
 
@@ -31,7 +32,7 @@ class AuthenticationClient(_Client):
 
     def fetch_auth_token(self, config: Dict, validity=2) -> str:
         """
-        Generates JWT token from the personal access token provided via the `config` parameter
+        Generates JWT token from the personal access token provided via the `config` parameter. Tokens are cached per `config` and `validity`, and a cached token is returned for as long as at least half of its validity remains.
 
         :param config: A Personal access token provided by the Cortex Console,represented as a python dict
         :type config: Dict
@@ -42,5 +43,4 @@ class AuthenticationClient(_Client):
         :return: A JWT token in string form
         :rtype: str
         """  # pylint: disable=line-too-long
-        token = generate_token(config, validity=validity)
-        return token
+        return cached_token(config, validity=validity)
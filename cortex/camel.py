@@ -22,25 +22,25 @@ class Document:
     Defines document (read-only) attributes.
     """
 
+    __slots__ = ("_document", "_read_only")
+
     def __init__(self, document: Dict, read_only=True):
         super().__setattr__("_document", document or {})
         super().__setattr__("_read_only", read_only)
 
     def __getattr__(self, name):
+        # Only called when regular lookup fails, `_document` itself is a slot
         if name.startswith("_"):
             return super().__getattribute__(name)
-
-        doc = super().__getattribute__("_document")
-        return doc.get(name)
+        return self._document.get(name)
 
     def __setattr__(self, name: str, value):
         if name.startswith("_"):
             super().__setattr__(name, value)
-        elif super().__getattribute__("_read_only"):
+        elif self._read_only:
             raise AttributeError("Attempt to modify a read-only attribute: %s" % name)
         else:
-            doc = super().__getattribute__("_document")
-            doc[name] = value
+            self._document[name] = value
 
 
 class CamelResource(Document):
@@ -48,6 +48,8 @@ class CamelResource(Document):
     Contains CAMEL attributes for a Cortex object.
     """
 
+    __slots__ = ()
+
     @property
     def name(self):
         """
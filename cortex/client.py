@@ -14,19 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import importlib
+import json
 import os
+import threading
 import time
+from collections import OrderedDict
+from typing import List, TYPE_CHECKING
 from .constant import VERSION
-from .experiment.local import LocalExperiment
-from .connection import ConnectionClient
-from .content import ManagedContentClient
-from .model import ModelClient
-from .secrets import SecretsClient
-from .session import SessionClient
-from .skill import SkillClient
-from .types import TypeClient
-from .experiment import ExperimentClient
-from .serviceconnector import ServiceConnector
+from .serviceconnector import ServiceConnector, pooled_session, TOKEN_EXPIRY_MARGIN
 from .env import CortexEnv
 from .exceptions import (
     ProjectException,
@@ -34,26 +30,89 @@ from .exceptions import (
     IncompleteMessageKeysException,
 )
 from .message import Message
-from .utils import decode_JWT, get_logger, generate_token
+from .utils import cached_token, decode_JWT, get_logger
+
+if TYPE_CHECKING:
+    # resolves the return annotations below; at runtime these are imported lazily
+    from .connection import ConnectionClient
+    from .content import ManagedContentClient
+    from .experiment import ExperimentClient
+    from .experiment.local import LocalExperiment
+    from .model import ModelClient
+    from .secrets import SecretsClient
+    from .session import SessionClient
+    from .skill import SkillClient
+    from .types import TypeClient
 
 log = get_logger(__name__)
 
+# Most recently used clients, keyed by their resolved arguments, returned again by
+# Cortex.client() for identical arguments. Their connectors regenerate tokens from a
+# PAT config before they expire, so a cached client never sends an expired token.
+_CLIENT_CACHE = OrderedDict()
+_CLIENT_CACHE_SIZE = 16
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Keys a skill message needs for Cortex.from_message to build a client
+MESSAGE_KEYS = ("apiEndpoint", "token", "projectId")
+_MESSAGE_KEY_SET = frozenset(MESSAGE_KEYS)
+
+
+# Classes imported on first use rather than with this module: the service client modules
+# are only loaded once the matching Client property is used, and LocalExperiment (with the
+# yaml-backed property store behind it) only for Cortex.local()
+_LAZY_IMPORTS = {
+    "ConnectionClient": ".connection",
+    "ManagedContentClient": ".content",
+    "ExperimentClient": ".experiment",
+    "ModelClient": ".model",
+    "SecretsClient": ".secrets",
+    "SessionClient": ".session",
+    "SkillClient": ".skill",
+    "TypeClient": ".types",
+    "LocalExperiment": ".experiment.local",
+}
+
+
+def _lazy_import(name: str):
+    return getattr(importlib.import_module(_LAZY_IMPORTS[name], __package__), name)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy_import(name)
+
 
 class _Token:
+    __slots__ = ("_token", "_jwt", "_exp")
+
     def __init__(self, token: str):
+        self.refresh(token)
+
+    def refresh(self, token: str):
+        """Replaces the token held by this instance
+
+        :param token: The new token
+        :type token: str
+        """
         self._token = token
         self._jwt = None
+        # expiry (seconds since the epoch) read once from the claims, 0 means no token
+        self._exp = 0.0
         if token:
             self._jwt = decode_JWT(self._token)
+            self._exp = float(self._jwt[1].get("exp", 0))
 
-    def is_expired(self) -> bool:
+    def is_expired(self, margin: float = 0) -> bool:
         """Checks if the token's JWT has expired
 
+        :param margin: Also treat the JWT as expired when it expires within this many seconds, defaults to 0
+        :type margin: float, optional
         :return: A boolean indicating if the JWT has expired
         :rtype: bool
-        """
-        current_time = time.time()
-        return not self._jwt or (self._jwt[0].get("exp", current_time) < current_time)
+        """  # pylint: disable=line-too-long
+        return self._exp - margin <= time.time()
 
     @property
     def token(self) -> str:
@@ -66,6 +125,7 @@ class _Token:
 
 
 class Client:
+    # pylint: disable=too-many-instance-attributes
     """
     API client used to access Connections, Managed Content, Experiments, Secrets, Models, Sessions, Skills and Types in a Fabric cluster. Experiments also have a `local client` (:class:`cortex.experiment.local.LocalExperiment`) for data scientists to work without access to a Fabric cluster.
 
@@ -116,6 +176,28 @@ class Client:
     :param version: (optional) Fabric API version (default: 4)
     """  # pylint: disable=line-too-long
 
+    _SERVICE_CLIENT_TYPES = {
+        "connections": "ConnectionClient",
+        "content": "ManagedContentClient",
+        "experiments": "ExperimentClient",
+        "models": "ModelClient",
+        "secrets": "SecretsClient",
+        "sessions": "SessionClient",
+        "skills": "SkillClient",
+        "types": "TypeClient",
+    }
+
+    __slots__ = (
+        "_token",
+        "_config",
+        "_project",
+        "_url",
+        "_version",
+        "_verify_ssl_cert",
+        "_session",
+        "_service_clients",
+    )
+
     def __init__(
         self,
         url: str,
@@ -131,17 +213,12 @@ class Client:
         self._url = url
         self._version = version
         self._verify_ssl_cert = verify_ssl_cert
+        # shared by every connector made from this client, so all service clients draw
+        # from one pool of keep-alive connections
+        self._session = pooled_session()
 
-        self._service_clients = {
-            "connections": ConnectionClient(self),
-            "content": ManagedContentClient(self),
-            "experiments": ExperimentClient(self),
-            "models": ModelClient(self),
-            "secrets": SecretsClient(self),
-            "sessions": SessionClient(self),
-            "skills": SkillClient(self),
-            "types": TypeClient(self),
-        }
+        # service clients are created on first access, see _service_client()
+        self._service_clients = {}
 
     def message(self, payload: dict, properties: dict = None) -> Message:
         """Constructs a Message from payload and properties if given. This is useful for
@@ -150,16 +227,55 @@ class Client:
         :param properties: The properties to include in the Message.
         :return: A Message object.
         """
-        if not self._token.token:
-            self._token = _Token(generate_token(self._config))
-        params = {"payload": payload}
+        params = {
+            "payload": payload,
+            "apiEndpoint": self._url,
+            "token": self._ensure_token(),
+        }
         if properties:
             params["properties"] = properties
-        params["apiEndpoint"] = self._url
-        params["token"] = self._token.token
         return Message(params)
 
+    def messages(self, payloads: List[dict], properties: dict = None) -> List[Message]:
+        """Constructs one Message per payload in `payloads`, all with the same `properties` if given. The token is checked, and regenerated if needed, once for the whole batch instead of once per message.
+
+        >>> msgs = client.messages([{"text": "a"}, {"text": "b"}], properties={"lang": "en"})
+
+        :param payloads: The payloads to create Messages for
+        :type payloads: List[dict]
+        :param properties: The properties to include in every Message, defaults to None
+        :type properties: dict, optional
+        :return: A list of Message objects, in the order of `payloads`
+        :rtype: List[Message]
+        """  # pylint: disable=line-too-long
+        common = {"apiEndpoint": self._url, "token": self._ensure_token()}
+        if properties:
+            common["properties"] = properties
+        return [Message({"payload": payload, **common}) for payload in payloads]
+
+    def _service_client(self, name: str, project: str = None):
+        # a client for this client's own project is the same as the default one
+        if project is not None and project != self._project:
+            return _lazy_import(self._SERVICE_CLIENT_TYPES[name])(self, project=project)
+        client = self._service_clients.get(name)
+        if client is None:
+            client = self._service_clients.setdefault(
+                name, _lazy_import(self._SERVICE_CLIENT_TYPES[name])(self)
+            )
+        return client
+
+    def _ensure_token(self) -> str:
+        # Generate a missing token, and regenerate an expiring one locally from the PAT
+        # config instead of sending it and finding out from a 401. Tokens given without a
+        # config are used as they are. Returns the token to use.
+        token = self._token
+        if not token.token or (self._config and token.is_expired(TOKEN_EXPIRY_MARGIN)):
+            token.refresh(cached_token(self._config))
+        return token.token
+
     def _mk_connector(self):
+        if self._token.token:
+            self._ensure_token()
         return ServiceConnector(
             self._url,
             self._version,
@@ -167,8 +283,22 @@ class Client:
             self._config,
             self._verify_ssl_cert,
             self._project,
+            session=self._session,
         )
 
+    def close(self):
+        """Closes the pooled HTTP connections shared by the service clients of this client, and the retrying sessions each of them keeps. The client stays usable, connections are reopened on the next request."""  # pylint: disable=line-too-long
+        for client in list(self._service_clients.values()):
+            # pylint: disable=protected-access
+            client._serviceconnector.close()
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     # expose this to allow developer to pass client instance into Connectors
     def to_connector(self) -> ServiceConnector:
         """_summary_
@@ -180,12 +310,10 @@ class Client:
 
     def _repr_pretty_(self, p, cycle):
         # pylint: disable=unused-argument,invalid-name
-        p.text(str(self))
-        p.text(f"Url: {self._url}\n")
-        p.text(f"Project: {self._project}\n")
+        p.text(f"{self}Url: {self._url}\nProject: {self._project}\n")
 
     @property
-    def experiments(self) -> ExperimentClient:
+    def experiments(self) -> "ExperimentClient":
         """Returns a pre-initialised ExperimentClient whose project has been set to the project configured for the Cortex.client.
 
         If you want to access experiments for a project that is
@@ -206,9 +334,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric Experiments API.
         :rtype: :class:`cortex.experiment.ExperimentClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("experiments")
+        return self._service_client("experiments")
 
-    def experiments_client(self, project: str = None) -> ExperimentClient:
+    def experiments_client(self, project: str = None) -> "ExperimentClient":
         """Helper method to create a new :class:`cortex.experiment.ExperimentClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> expc = client.experiments_client(project="another-project")
@@ -218,12 +346,10 @@ class Client:
         :return: An experiment client
         :rtype: :class:`cortex.experiment.ExperimentClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return ExperimentClient(project=project)
-        return self.experiments
+        return self._service_client("experiments", project)
 
     @property
-    def connections(self) -> ConnectionClient:
+    def connections(self) -> "ConnectionClient":
         """Returns a pre-initialised ConnectionClient whose project has been set to the project configured for the Cortex.client.
 
         If you want to access connections for a project that is
@@ -242,9 +368,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric Connections API.
         :rtype: :class:`cortex.connection.ConnectionClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("connections")
+        return self._service_client("connections")
 
-    def connections_client(self, project: str = None) -> ConnectionClient:
+    def connections_client(self, project: str = None) -> "ConnectionClient":
         """Helper method to create a new :class:`cortex.connection.ConnectionClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> connc = client.connections_client(project="another-project")
@@ -254,12 +380,10 @@ class Client:
         :return: A connection client
         :rtype: :class:`cortex.connection.ConnectionClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return ConnectionClient(project=project)
-        return self.connections
+        return self._service_client("connections", project)
 
     @property
-    def content(self) -> ManagedContentClient:
+    def content(self) -> "ManagedContentClient":
         """Returns a pre-initialised ManagedContentClient whose project has been set to the project configured for the Cortex.client.
 
         If you want to access managed content for a project that is
@@ -280,9 +404,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric Managed Content API.
         :rtype: :class:`cortex.content.ManagedContentClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("content")
+        return self._service_client("content")
 
-    def content_client(self, project: str = None) -> ManagedContentClient:
+    def content_client(self, project: str = None) -> "ManagedContentClient":
         """Helper method to create a new :class:`cortex.connection.ManagedContentClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> contentc = client.content_client(project="another-project")
@@ -292,12 +416,10 @@ class Client:
         :return: A managed content client
         :rtype: :class:`cortex.connection.ManagedContentClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return ManagedContentClient(project=project)
-        return self.content
+        return self._service_client("content", project)
 
     @property
-    def models(self) -> ModelClient:
+    def models(self) -> "ModelClient":
         """Returns a pre-initialised ModelClient whose project has been set to the project configured for the Cortex.client.
 
         If you want to access models for a project that is
@@ -318,9 +440,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric Models API.
         :rtype: :class:`cortex.model.ModelClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("models")
+        return self._service_client("models")
 
-    def models_client(self, project: str = None) -> ModelClient:
+    def models_client(self, project: str = None) -> "ModelClient":
         """Helper method to create a new :class:`cortex.model.ModelClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> modelc = client.models_client(project="another-project")
@@ -330,12 +452,10 @@ class Client:
         :return: A models client
         :rtype: :class:`cortex.model.ModelClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return ModelClient(project=project)
-        return self.models
+        return self._service_client("models", project)
 
     @property
-    def secrets(self) -> SecretsClient:
+    def secrets(self) -> "SecretsClient":
         """Returns a pre-initialised SecretsClient whose project has been set to the project configured for the Cortex.client.
 
         .. important::
@@ -359,9 +479,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric Secrets API.
         :rtype: :class:`cortex.secrets.SecretsClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("secrets")
+        return self._service_client("secrets")
 
-    def secrets_client(self, project: str = None) -> SecretsClient:
+    def secrets_client(self, project: str = None) -> "SecretsClient":
         """Helper method to create a new :class:`cortex.secrets.SecretsClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> secretsc = client.secrets_client(project="another-project")
@@ -371,12 +491,10 @@ class Client:
         :return: A secrets client
         :rtype: :class:`cortex.secrets.SecretsClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return SecretsClient(project=project)
-        return self.secrets
+        return self._service_client("secrets", project)
 
     @property
-    def skills(self) -> SkillClient:
+    def skills(self) -> "SkillClient":
         """Returns a pre-initialised SkillClient whose project has been set to the project configured for the Cortex.client.Client
 
         If you want to access Skills for a project that is
@@ -400,9 +518,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric SKills API.
         :rtype: :class:`cortex.skill.SkillClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("skills")
+        return self._service_client("skills")
 
-    def skills_client(self, project: str = None) -> SkillClient:
+    def skills_client(self, project: str = None) -> "SkillClient":
         """Helper method to create a new :class:`cortex.skill.SkillClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> skillsc = client.skills_client(project="another-project")
@@ -412,12 +530,10 @@ class Client:
         :return: A Skills client
         :rtype: :class:`cortex.skill.SkillClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return SkillClient(project=project)
-        return self.skills
+        return self._service_client("skills", project)
 
     @property
-    def sessions(self) -> SessionClient:
+    def sessions(self) -> "SessionClient":
         """Returns a pre-initialised SessionClient whose project has been set to the project configured for the Cortex.client.Client
 
         If you want to access Sessions for a project that is
@@ -439,9 +555,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric Sessions API.
         :rtype: :class:`cortex.session.SessionClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("sessions")
+        return self._service_client("sessions")
 
-    def sessions_client(self, project: str = None) -> SessionClient:
+    def sessions_client(self, project: str = None) -> "SessionClient":
         """Helper method to create a new :class:`cortex.session.SessionClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> sessionsc = client.sessions_client(project="another-project")
@@ -451,12 +567,10 @@ class Client:
         :return: A Sessions client
         :rtype: :class:`cortex.session.SessionClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return SessionClient(project=project)
-        return self.sessions
+        return self._service_client("sessions", project)
 
     @property
-    def types(self) -> TypeClient:
+    def types(self) -> "TypeClient":
         """Returns a pre-initialised TypeClient whose project has been set to the project configured for the Cortex.client.Client
 
         If you want to access Types for a project that is
@@ -476,9 +590,9 @@ class Client:
         :returns: An instance of this helper class that enables access to the Fabric Types API.
         :rtype: :class:`cortex.types.TypeClient`
         """  # pylint: disable=line-too-long
-        return self._service_clients.get("types")
+        return self._service_client("types")
 
-    def types_client(self, project: str = None) -> TypeClient:
+    def types_client(self, project: str = None) -> "TypeClient":
         """Helper method to create a new :class:`cortex.types.TypeClient` instance that is configured to talk to another `project` than the default :attr:`cortex.client.Client._project`
 
         >>> typesc = client.types_client(project="another-project")
@@ -488,9 +602,7 @@ class Client:
         :return: A Types client
         :rtype: :class:`cortex.types.TypeClient`
         """  # pylint: disable=line-too-long
-        if project is not None:
-            return TypeClient(project=project)
-        return self.types
+        return self._service_client("types", project)
 
 
 class Local:
@@ -498,16 +610,18 @@ class Local:
     Provides local, on-disk implementations of Cortex APIs.
     """
 
+    __slots__ = ("_basedir",)
+
     def __init__(self, basedir=None):
         self._basedir = basedir
 
-    def experiment(self, name: str) -> LocalExperiment:
+    def experiment(self, name: str) -> "LocalExperiment":
         """
         Create an experiment without connecting to Cortex fabric
         :param name: Experiment name
         :return: Experiment instance
         """
-        return LocalExperiment(name, self.basedir)
+        return _lazy_import("LocalExperiment")(name, self.basedir)
 
     @property
     def basedir(self):
@@ -548,6 +662,8 @@ class Cortex:
         >>> from cortex.client import Cortex
         >>> cortex = Cortex.client(project='example-project')
 
+        Calls that resolve to the same endpoint, version, credentials, project and SSL setting return the same :class:`cortex.client.Client` instance (the 16 most recently used ones are kept), so its service clients and pooled connections are reused instead of being rebuilt. As the instance is shared, do not close it (for example in a `with` block) while other code may still be sending requests through it.
+
         :param api_endpoint: The Cortex URL.
         :param api_version: The version of the API to use with this client.
         :param verify_ssl_cert: A boolean to enable/disable SSL validation, or path to a CA_BUNDLE file or directory with certificates of trusted CAs (default: True)
@@ -566,33 +682,42 @@ class Cortex:
             profile=profile,
         )
 
-        if not api_endpoint:
-            api_endpoint = env.api_endpoint
-
-        if not token:
-            token = env.token
-
-        if not config:
-            config = env.config
-
-        if not project:
-            project = env.project
-
-        if not project:
+        # CortexEnv already prefers the explicit arguments over the environment and profile
+        if not env.project:
             raise ProjectException(
                 "Please Provide Project Name that you want to access Cortex Assets for"
             )
 
-        tkn = _Token(token)
-
-        return Client(
-            url=api_endpoint,
+        key = (
+            env.api_endpoint,
+            api_version,
+            env.token,
+            json.dumps(env.config, sort_keys=True) if env.config else None,
+            env.project,
+            verify_ssl_cert,
+        )
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is not None:
+                _CLIENT_CACHE.move_to_end(key)
+                return client
+
+        client = Client(
+            url=env.api_endpoint,
             version=api_version,
-            token=tkn,
-            config=config,
-            project=project,
+            token=_Token(env.token),
+            config=env.config,
+            project=env.project,
             verify_ssl_cert=verify_ssl_cert,
         )
+        # evicted clients are only dereferenced, not closed: other callers may still be
+        # using them, and their pools are released once they are garbage collected
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.setdefault(key, client)
+            _CLIENT_CACHE.move_to_end(key)
+            while len(_CLIENT_CACHE) > _CLIENT_CACHE_SIZE:
+                _CLIENT_CACHE.popitem(last=False)
+        return client
 
     @staticmethod
     def from_message(msg, verify_ssl_cert=None) -> Client:
@@ -612,10 +737,11 @@ class Cortex:
             raise InvalidMessageTypeException(
                 f"Skill message must be a `dict` not a {type(msg)}"
             )
-        keys = ("apiEndpoint", "token", "projectId")
-        if not all(key in msg for key in keys):
+        missing = _MESSAGE_KEY_SET - msg.keys()
+        if missing:
             raise IncompleteMessageKeysException(
-                f"Skill message must contain these keys: {keys}"
+                f"Skill message must contain these keys: {MESSAGE_KEYS}, "
+                f"missing: {sorted(missing)}"
             )
         return Cortex.client(
             api_endpoint=msg.get("apiEndpoint"),
@@ -14,12 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 import os
-import urllib.parse
+from typing import List
 from .serviceconnector import _Client
 from .camel import CamelResource
-from .utils import get_logger, raise_for_status_with_detail
+from .utils import get_logger, raise_for_status_with_detail, json_dumps, json_loads
+from .utils import parse_string, map_requests, JSON_HEADERS
 
 log = get_logger(__name__)
 
@@ -32,7 +32,15 @@ class ConnectionClient(_Client):
     :return: An instance of a ConnectionClient
     """
 
-    URIs = {"connections": "projects/{projectId}/connections"}
+    URIs = {
+        "connections": "projects/{projectId}/connections",
+        "bootstrap": "projects/{projectId}/connections/_/bootstrap",
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # internal connections service URL, derived from the connector URL on first use
+        self._connections_service_url = None
 
     def save_connection(self, connection: dict) -> dict:
         """Saves the provided `connection` dictionary to the Fabric API server.
@@ -43,11 +51,24 @@ class ConnectionClient(_Client):
         :rtype: dict
         """  # pylint: disable=line-too-long
         uri = self.URIs["connections"].format(projectId=self._project())
-        data = json.dumps(connection)
-        headers = {"Content-Type": "application/json"}
-        res = self._serviceconnector.request("POST", uri, data, headers)
+        data = json_dumps(connection)
+        res = self._serviceconnector.request("POST", uri, data, JSON_HEADERS)
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
+
+    def save_connections(
+        self, connections: List[dict], max_workers: int = 8
+    ) -> List[dict]:
+        """Saves several connections concurrently, from a pool of up to `max_workers` threads. The results are in the same order as `connections`, and a failed save holds the HTTP `status` and `error` of the failure instead of aborting the others.
+
+        :param connections: Python dictionaries, each one specifying a connection as in :meth:`save_connection`
+        :type connections: List[dict]
+        :param max_workers: Maximum number of saves in flight at once, defaults to 8
+        :type max_workers: int, optional
+        :return: One response (or error) dictionary per entry in `connections`
+        :rtype: List[dict]
+        """  # pylint: disable=line-too-long
+        return map_requests(self.save_connection, connections, max_workers)
 
     def get_connection(self, name: str) -> dict:
         """Fetch the specific connection in the `name` argument and return the details as a python dictionary
@@ -57,23 +78,24 @@ class ConnectionClient(_Client):
         :return: A python dictionary containing the specified connection details
         :rtype: dict
         """  # pylint: disable=line-too-long
-        port = (
-            os.getenv("CORTEX_CONNECTIONS_SERVICE_PORT_HTTP_CORTEX_CONNECTIONS")
-            or "4450"
-        )
-        conn_svc_url = f'{self._serviceconnector.url.replace("cortex-internal", "cortex-connections")}:{port}'  # pylint: disable=line-too-long
-        uri = f'{conn_svc_url}/internal/projects/{self._project()}/connections/{urllib.parse.quote(name, safe="")}'  # pylint: disable=line-too-long
-        log.debug("Getting connection using URI: {}", uri)
+        if self._connections_service_url is None:
+            port = (
+                os.getenv("CORTEX_CONNECTIONS_SERVICE_PORT_HTTP_CORTEX_CONNECTIONS")
+                or "4450"
+            )
+            self._connections_service_url = f'{self._serviceconnector.url.replace("cortex-internal", "cortex-connections")}:{port}'  # pylint: disable=line-too-long
+        uri = f"{self._connections_service_url}/internal/projects/{self._project()}/connections/{parse_string(name)}"  # pylint: disable=line-too-long
+        log.debug("Getting connection using URI: %s", uri)
         res = self._serviceconnector.request("GET", uri=uri, is_internal_url=True)
         raise_for_status_with_detail(res)
 
-        return res.json()
+        return json_loads(res.content)
 
     def _bootstrap(self):
-        uri = self.URIs["connections"] + "/_/bootstrap"
+        uri = self.URIs["bootstrap"].format(projectId=self._project())
         res = self._serviceconnector.request("GET", uri=uri)
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
 
 
 class Connection(CamelResource):
@@ -15,15 +15,13 @@ limitations under the License.
 """
 
 import os
-import glob
-import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, StringIO, FileIO
 from typing import Union, List
 from urllib3.response import HTTPResponse
 
 
 from requests_toolbelt.multipart.encoder import MultipartEncoder
-from requests.exceptions import HTTPError
 
 from .serviceconnector import _Client
 from .utils import (
@@ -33,6 +31,10 @@ from .utils import (
 
 log = get_logger(__name__)
 
+# Read buffer used when streaming local files, larger than the 8/16 KiB
+# blocks the HTTP layer asks for so a big file is read in few syscalls
+UPLOAD_BUFFER_SIZE = 1 << 20
+
 
 class ManagedContentClient(_Client):
     """
@@ -82,8 +84,9 @@ class ManagedContentClient(_Client):
         retries: int = 1,
     ):
         uri = self.URIs["content"].format(projectId=self._project())
-        fields = {"key": key, "content": (stream_name, stream, content_type)}
-        data = MultipartEncoder(fields=fields)
+        data = MultipartEncoder(
+            fields=[("key", key), ("content", (stream_name, stream, content_type))]
+        )
         headers = {"Content-Type": data.content_type}
         res = self._serviceconnector.request_with_retry(
             "POST", uri=uri, body=data, headers=headers, retries=retries
@@ -93,13 +96,33 @@ class ManagedContentClient(_Client):
 
     @staticmethod
     def _get_source_files(source):
-        source_regex = os.path.join(source, "**/*")
-        for path in glob.iglob(source_regex, recursive=True):
-            if os.path.isfile(path):
-                yield {"canonical": path, "relative": path[len(source) :]}
+        # (canonical path, path relative to source) pairs
+        prefix_len = len(source)
+        for path in ManagedContentClient._walk_files(source):
+            yield path, path[prefix_len:]
 
-    def upload_directory(self, source: str, destination: str, retries: int = 1) -> dict:
-        """Walk source directory and store in Managed Content
+    @staticmethod
+    def _walk_files(directory):
+        # Same files and order as glob's recursive "**/*" (a directory's files before
+        # its subdirectories, hidden entries skipped, symlinks followed), but
+        # os.scandir entries carry their file type, so no extra stat() per path.
+        # Like glob, a missing or unreadable directory, or a file, yields nothing.
+        try:
+            with os.scandir(directory) as scanned:
+                entries = [entry for entry in scanned if not entry.name.startswith(".")]
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_file():
+                yield entry.path
+        for entry in entries:
+            if entry.is_dir():
+                yield from ManagedContentClient._walk_files(entry.path)
+
+    def upload_directory(
+        self, source: str, destination: str, retries: int = 1, max_workers: int = 8
+    ) -> List[dict]:
+        """Walk source directory and store in Managed Content. Files are uploaded concurrently from a pool of up to `max_workers` threads sharing this client's retrying keep-alive session.
 
         :param source: The path to the local directory.
         :type source: str
@@ -107,25 +130,38 @@ class ManagedContentClient(_Client):
         :type destination: str
         :param retries: Number of times to retry a failed request from a retryable response, defaults to 1
         :type retries: int, optional
-        :return: A dict with the response to request upload.
-        :rtype: dict
-        """
+        :param max_workers: Maximum number of files uploaded at once, defaults to 8. Use 1 to upload the files one after the other.
+        :type max_workers: int, optional
+        :return: A list with the response to each file upload, in the order the files were found.
+        :rtype: List[dict]
+        """  # pylint: disable=line-too-long
         source_path = source
         if not source.endswith("/"):
             source_path = source_path + "/"
 
-        generated_paths = ManagedContentClient._get_source_files(source_path)
-        responses = []
-        for path_dict in generated_paths:
-            key = os.path.join(destination, path_dict.get("relative"))
-            with open(path_dict.get("canonical"), "rb") as stream:
-                responses.append(
-                    self.upload_streaming(
-                        key, stream, "application/octet-stream", retries
-                    )
+        generated_paths = list(ManagedContentClient._get_source_files(source_path))
+        if not generated_paths:
+            return []
+        # content keys are "/" separated and relative paths never start with a
+        # separator, so a plain prefix replaces an os.path.join per file
+        key_prefix = destination.rstrip("/") + "/" if destination else ""
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(generated_paths))
+        ) as pool:
+            return list(
+                pool.map(
+                    lambda paths: self._upload_file(
+                        paths[0], key_prefix + paths[1], retries
+                    ),
+                    generated_paths,
                 )
+            )
 
-        return responses
+    def _upload_file(self, path: str, key: str, retries: int) -> dict:
+        with open(path, "rb", buffering=UPLOAD_BUFFER_SIZE) as stream:
+            return self.upload_streaming(
+                key, stream, "application/octet-stream", retries
+            )
 
     def upload_streaming(
         self,
@@ -233,16 +269,6 @@ class ManagedContentClient(_Client):
 
     ## Private ##
 
-    @staticmethod
-    def _http_request_retry_predicate(exception: Exception) -> bool:
-        if isinstance(exception, HTTPError):
-            retry_after = exception.response.headers.get("Retry-After")
-            if retry_after:
-                # NOTE: sleep in predicate, ugly, but how to extract this?
-                time.sleep(retry_after)
-                return True
-        return False
-
     def _make_content_uri(self, key: str):
         return (
             self.URIs["content"].format(projectId=self._project())
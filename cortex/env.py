@@ -39,12 +39,16 @@ class CortexEnv:
         project: str = None,
         profile: str = None,
     ):
-        profile_inst = CortexEnv.get_cortex_profile(profile)
-
         cortex_token = token or os.getenv("CORTEX_TOKEN")
-        cortex_config = config or json.loads(
-            os.getenv("CORTEX_PERSONAL_ACCESS_CONFIG", json.dumps(profile_inst))
-        )
+        cortex_config = config
+        if not cortex_config:
+            env_config = os.getenv("CORTEX_PERSONAL_ACCESS_CONFIG")
+            # only fall back to the CLI profile when no config was given
+            cortex_config = (
+                json.loads(env_config)
+                if env_config is not None
+                else CortexEnv.get_cortex_profile(profile)
+            )
         if not cortex_token and not cortex_config:
             raise BadTokenException(BAD_TOKEN_MSG)
 
@@ -20,7 +20,6 @@ import os
 from pathlib import Path
 from contextlib import closing
 from datetime import datetime
-import dill
 
 from .model import Run, _to_html
 from ..exceptions import ConfigurationException
@@ -107,6 +106,8 @@ class LocalExperiment:
         self._config.set(self._config.join(self.root_key, self.runs_key), updated_runs)
         self._save_config()
 
+        import dill  # pylint: disable=import-outside-toplevel
+
         for name, artifact in run.artifacts.items():
             with closing(open(self.get_artifact_path(run, name), "wb")) as file_d:
                 dill.dump(artifact, file_d)
@@ -197,6 +198,8 @@ class LocalExperiment:
         :return: Python objects loaded into memory from the artifact content
         :rtype: Any
         """
+        import dill  # pylint: disable=import-outside-toplevel
+
         artifact_file = self.get_artifact_path(run, name, extension)
         with closing(open(artifact_file, "rb")) as file_d:
             return dill.load(file_d)
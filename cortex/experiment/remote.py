@@ -20,7 +20,6 @@ import os
 from typing import Dict, List
 
 import tempfile
-import dill
 
 
 from .model import Run, _to_html
@@ -33,10 +32,18 @@ from ..exceptions import (
 )
 from ..serviceconnector import _Client
 from ..utils import raise_for_status_with_detail, get_logger, parse_string
+from ..utils import json_dumps, JSON_HEADERS
 
 log = get_logger(__name__)
 
 
+def _dill_loads(data: bytes):
+    # dill is only needed for (de)serializing artifacts, so it is not imported up front
+    import dill  # pylint: disable=import-outside-toplevel
+
+    return dill.loads(data)
+
+
 class ExperimentClient(_Client):
     """
     A client for the `Cortex experiment and model management API <https://cognitivescale.github.io/cortex-fabric/docs/models/experiments>`_. You can find a pre-created instance of this class on every :class:`cortex.client.Client` instance via the :attr:`Client.experiments` attribute.
@@ -45,7 +52,7 @@ class ExperimentClient(_Client):
     >>> client.experiments.list_experiments() # list experiments from the default project configured for the user
     """  # pylint: disable=line-too-long
 
-    headers = {"Content-Type": "application/json"}
+    headers = JSON_HEADERS
 
     URIs = {
         "experiments": "projects/{projectId}/experiments",
@@ -96,19 +103,15 @@ class ExperimentClient(_Client):
         :return: A dictionary with metadata about the saved experiment
         :rtype: Dict
         """
+        body_obj = {"name": experiment_name}
         if model_id:
-            body_obj = {"name": experiment_name, "modelId": model_id}
-        else:
-            body_obj = {"name": experiment_name}
-
-        if kwargs:
-            body_obj.update(kwargs)
+            body_obj["modelId"] = model_id
+        body_obj.update(kwargs)
 
-        body = json.dumps(body_obj)
-        headers = {"Content-Type": "application/json"}
+        body = json_dumps(body_obj)
         uri = self.URIs["experiments"].format(projectId=self._project())
         res = self._serviceconnector.request(
-            method="POST", uri=uri, body=body, headers=headers
+            method="POST", uri=uri, body=body, headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         return res.json()
@@ -260,18 +263,13 @@ class ExperimentClient(_Client):
         :return: A dictionary providing a JSON representation of the created run
         :rtype: Dict
         """
-        body_obj = {}
-
-        if kwargs:
-            body_obj.update(kwargs)
-
-        body = json.dumps(body_obj)
-        headers = {"Content-Type": "application/json"}
+        # kwargs is already a fresh dict holding exactly the request body
+        body = json_dumps(kwargs)
         uri = self.URIs["runs"].format(
             projectId=self._project(), experimentName=parse_string(experiment_name)
         )
         res = self._serviceconnector.request(
-            method="POST", uri=uri, body=body, headers=headers
+            method="POST", uri=uri, body=body, headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         return res.json()
@@ -301,6 +299,29 @@ class ExperimentClient(_Client):
 
         return res.json()
 
+    def get_runs(self, experiment_name: str, run_ids: List[str]) -> Dict[str, Dict]:
+        """Get the details of several runs of an `experiment_name` with a single request, instead of one :meth:`get_run` call per run
+
+        >>> from cortex.client import Cortex; cc=Cortex.client(project='test')
+        >>> cc.experiments.get_runs('op-gc_dtree_exp', ['ox00gu0', 'run_01'])
+        {'ox00gu0': {'runId': 'ox00gu0', ...}, 'run_01': {'runId': 'run_01', ...}}
+
+        :raises: :exc:`requests.exceptions.HTTPError`
+        :param experiment_name: Name of the experiment whose runs are to be retrieved
+        :type experiment_name: str
+        :param run_ids: IDs of the runs to be retrieved
+        :type run_ids: List[str]
+        :return: A dictionary mapping each found run ID to the JSON representation of that run, IDs that don't exist are left out
+        :rtype: Dict[str, Dict]
+        """  # pylint: disable=line-too-long
+        run_ids = list(dict.fromkeys(run_ids))
+        if not run_ids:
+            return {}
+        runs = self.find_runs(
+            experiment_name, {"runId": {"$in": run_ids}}, limit=len(run_ids)
+        )
+        return {run["runId"]: run for run in runs}
+
     def update_run(self, experiment_name: str, run_id: str, **kwargs) -> bool:
         """Updates a run and returns the boolean status of the operation. Refer to the `official UpdateRun docs <https://cognitivescale.github.io/cortex-fabric/swagger/index.html#operation/UpdateRun>`_ for information on other possible `kwargs` this method can accept
 
@@ -312,20 +333,15 @@ class ExperimentClient(_Client):
         :return: Boolean indicating the status of the operation
         :rtype: bool
         """
-        body_obj = {}
-
-        if kwargs:
-            body_obj.update(kwargs)
-
-        body = json.dumps(body_obj)
-        headers = {"Content-Type": "application/json"}
+        # kwargs is already a fresh dict holding exactly the request body
+        body = json_dumps(kwargs)
         uri = self.URIs["run"].format(
             projectId=self._project(),
             experimentName=parse_string(experiment_name),
             runId=run_id,
         )
         res = self._serviceconnector.request(
-            method="PUT", uri=uri, body=body, headers=headers
+            method="PUT", uri=uri, body=body, headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         res_json = res.json()
@@ -387,9 +403,8 @@ class ExperimentClient(_Client):
             runId=run_id,
             metaId=meta,
         )
-        headers = {"Content-Type": "application/json"}
         res = self._serviceconnector.request(
-            method="PUT", uri=uri, body=json.dumps({"value": val}), headers=headers
+            method="PUT", uri=uri, body=json_dumps({"value": val}), headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         res_json = res.json()
@@ -426,9 +441,8 @@ class ExperimentClient(_Client):
             runId=run_id,
             paramId=param,
         )
-        headers = {"Content-Type": "application/json"}
         res = self._serviceconnector.request(
-            method="PUT", uri=uri, body=json.dumps({"value": val}), headers=headers
+            method="PUT", uri=uri, body=json_dumps({"value": val}), headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         res_json = res.json()
@@ -464,9 +478,8 @@ class ExperimentClient(_Client):
             runId=run_id,
             metricId=metric,
         )
-        headers = {"Content-Type": "application/json"}
         res = self._serviceconnector.request(
-            method="PUT", uri=uri, body=json.dumps({"value": val}), headers=headers
+            method="PUT", uri=uri, body=json_dumps({"value": val}), headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         res_json = res.json()
@@ -653,7 +666,7 @@ class Experiment(CamelResource):
         :return: Unpickled object loaded into memory by dill
         :rtype: any
         """
-        return dill.loads(self._client.get_artifact(self.name, run.id, name))
+        return _dill_loads(self._client.get_artifact(self.name, run.id, name))
 
     def to_camel(self, camel: str = "1.0.0") -> Dict:
         # pylint: disable=duplicate-code
@@ -801,6 +814,8 @@ class RemoteRun(Run):
             with open(artifact["ref"], "rb") as stream:
                 self.log_artifact_stream(name, stream)
         else:
+            import dill  # pylint: disable=import-outside-toplevel
+
             stream = io.BytesIO()
             dill.dump(artifact, stream)
             stream.seek(0)
@@ -828,7 +843,7 @@ class RemoteRun(Run):
             model.save(filepath=temp.name)
             self.log_artifact_file(artifact_name, temp.name)
 
-    def get_artifact(self, name: str, deserializer=dill.loads) -> bytes:
+    def get_artifact(self, name: str, deserializer=_dill_loads) -> bytes:
         """Gets an artifact with the given name.  Deserializes the artifact stream using dill by default.  Deserialization can be disabled entirely or the deserializer function can be overridden.
 
         :param name: Name of the artifact to be fetched
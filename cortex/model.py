@@ -14,12 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 from typing import Dict
 
 from .camel import CamelResource
 from .serviceconnector import _Client
-from .utils import raise_for_status_with_detail, parse_string
+from .utils import raise_for_status_with_detail, parse_string, json_dumps, JSON_HEADERS
 
 
 class ModelClient(_Client):
@@ -54,11 +53,10 @@ class ModelClient(_Client):
         :param model_obj: Model object to be saved or updated
         :return: status
         """
-        body = json.dumps(model_obj)
-        headers = {"Content-Type": "application/json"}
+        body = json_dumps(model_obj)
         uri = self.URIs["models"].format(projectId=self._project())
         res = self._serviceconnector.request(
-            method="POST", uri=uri, body=body, headers=headers
+            method="POST", uri=uri, body=body, headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         return res.json()
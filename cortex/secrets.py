@@ -14,11 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import os
-import json
 
 from .serviceconnector import _Client
 from .camel import CamelResource
 from .utils import get_logger, raise_for_status_with_detail, parse_string
+from .utils import json_dumps, JSON_HEADERS
 
 log = get_logger(__name__)
 
@@ -40,10 +40,9 @@ class SecretsClient(_Client):
         uri = self.URIs["secret"].format(
             secretName=parse_string(name), projectId=self._project()
         )
-        data = json.dumps(value)
-        headers = {"Content-Type": "application/json"}
+        data = json_dumps(value)
         res = self._serviceconnector.request(
-            "POST", uri=uri, body=data, headers=headers
+            "POST", uri=uri, body=data, headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
         return res.json()
@@ -58,7 +57,7 @@ class SecretsClient(_Client):
         port = os.getenv("CORTEX_ACCOUNTS_SERVICE_PORT_HTTP_CORTEX_ACCOUNTS") or "5000"
         conn_svc_url = f'{self._serviceconnector.url.replace("cortex-internal", "cortex-accounts")}:{port}'  # pylint: disable=line-too-long
         uri = f"{conn_svc_url}/internal/projects/{self._project()}/secrets/{parse_string(name)}"
-        log.debug("Getting Secret using URI: {}", uri)
+        log.debug("Getting Secret using URI: %s", uri)
         res = self._serviceconnector.request("GET", uri=uri, is_internal_url=True)
         raise_for_status_with_detail(res)
 
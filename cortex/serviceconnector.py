@@ -14,9 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
+import os
 import platform
 import sys
+import threading
+import time
 from typing import Dict, Any, List, Union, Optional, Type, TypeVar
 import requests
 from requests.adapters import HTTPAdapter
@@ -25,14 +27,51 @@ from urllib3.util.retry import Retry
 from .constant import VERSION
 from .__version__ import __version__, __title__
 
-from .utils import get_logger, get_cortex_profile, verify_JWT, generate_token
-from .utils import raise_for_status_with_detail
+from .utils import get_logger, get_cortex_profile, verify_JWT, cached_token, decode_JWT
+from .utils import raise_for_status_with_detail, json_dumps, json_loads, JSON_HEADERS
 
 log = get_logger(__name__)
 
 JSONType = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
 T = TypeVar("T", bound="_Client")
 
+# Number of keep-alive connections kept per host by a connector's session
+POOL_MAXSIZE = 32
+
+
+def _token_expiry_margin(default: float = 30.0) -> float:
+    # a malformed or negative CORTEX_TOKEN_SKEW must not make importing the sdk fail
+    value = os.getenv("CORTEX_TOKEN_SKEW")
+    if value is None:
+        return default
+    try:
+        margin = float(value)
+    except ValueError:
+        margin = -1.0
+    if not margin >= 0:
+        log.warning(
+            "Ignoring invalid CORTEX_TOKEN_SKEW %r, using %s seconds", value, default
+        )
+        return default
+    return margin
+
+
+# Seconds before expiry at which a token is regenerated, so it cannot lapse mid-request.
+# Can be overridden with the CORTEX_TOKEN_SKEW environment variable, read once on import.
+TOKEN_EXPIRY_MARGIN = _token_expiry_margin()
+
+
+def pooled_session() -> requests.Session:
+    """
+    Creates a session that keeps up to :data:`POOL_MAXSIZE` keep-alive connections per host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 userAgent = (
     f"{__title__}/{__version__} ({sys.platform};"
     f"{platform.architecture()[0]}; {platform.release()})"
@@ -40,12 +79,20 @@ userAgent = (
 
 
 class ServiceConnector:
+    # pylint: disable=too-many-instance-attributes
     """
     Defines the settings and security credentials required to access a service.
     """
 
     def __init__(
-        self, url, version=4, token=None, config=None, verify_ssl_cert=True, project=""
+        self,
+        url,
+        version=4,
+        token=None,
+        config=None,
+        verify_ssl_cert=True,
+        project="",
+        session=None,
     ):
         self.url = url
         self.version = version
@@ -53,6 +100,32 @@ class ServiceConnector:
         self._config = config
         self.verify_ssl_cert = verify_ssl_cert
         self.project = project
+        # a session passed in is shared with other connectors and closed by its owner
+        self._session = session
+        self._owns_session = session is None
+        self._retry_sessions = {}
+        # sessions are created on first use, possibly by several threads at once
+        self._session_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        # locks cannot be pickled, and pooled connections are not worth carrying to
+        # another process; they are recreated there on first use
+        state = self.__dict__.copy()
+        del state["_session_lock"]
+        state["_retry_sessions"] = {}
+        if self._owns_session:
+            state["_session"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._session_lock = threading.Lock()
 
     ## properties ##
 
@@ -78,10 +151,10 @@ class ServiceConnector:
         """
         headers_to_send = self._construct_headers(headers)
         url = self._construct_url(uri)
-        return requests.post(
+        return self._get_session().post(
             url,
             files=files,
-            body=data,
+            data=data,
             headers=headers_to_send,
             allow_redirects=False,
             verify=self.verify_ssl_cert,
@@ -105,8 +178,8 @@ class ServiceConnector:
         headers_to_send = self._construct_headers(headers)
         url = self._construct_url(uri)
         if debug:
-            log.debug("START {} {}".format("GET", uri))
-        res = ServiceConnector.requests_retry_session(retries=retries).request(
+            log.debug("START %s %s", method, uri)
+        res = self._get_retry_session(retries).request(
             method,
             url,
             data=body,
@@ -116,7 +189,7 @@ class ServiceConnector:
             **kwargs,
         )
         if debug:
-            log.debug("  END {} {}".format("GET", uri))
+            log.debug("  END %s %s", method, uri)
         return res
 
     def request(
@@ -144,8 +217,8 @@ class ServiceConnector:
         headers_to_send = self._construct_headers(headers)
         url = uri if is_internal_url else self._construct_url(uri)
         if debug:
-            log.debug("START {} {}".format(method, uri))
-        res = requests.request(
+            log.debug("START %s %s", method, uri)
+        res = self._get_session().request(
             method,
             url,
             data=body,
@@ -155,29 +228,46 @@ class ServiceConnector:
             **kwargs,
         )
         if debug:
-            log.debug("  END {} {}".format(method, uri))
+            log.debug("  END %s %s", method, uri)
         return res
 
+    def close(self):
+        """
+        Closes the pooled HTTP connections held by this connector. The connector stays usable, a new pool is created on the next request. A session shared through the constructor is left open for its owner to close.
+        """  # pylint: disable=line-too-long
+        with self._session_lock:
+            sessions = list(self._retry_sessions.values())
+            if self._owns_session:
+                if self._session is not None:
+                    sessions.append(self._session)
+                self._session = None
+            self._retry_sessions = {}
+        for session in sessions:
+            session.close()
+
     @staticmethod
     def requests_retry_session(
         retries=5,
         backoff_factor=0.5,
         status_forcelist=(500, 502, 503, 504),
         session=None,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
     ):
-        """_summary_
+        """Build a session whose transport retries failed requests with exponential backoff. Retries are handled by urllib3 inside the connection pool, so the keep-alive connections are reused across attempts.
 
-        :param retries: _description_, defaults to 5
+        :param retries: Maximum number of retries per request, defaults to 5
         :type retries: int, optional
-        :param backoff_factor: _description_, defaults to 0.5
+        :param backoff_factor: Backoff factor between attempts in seconds, defaults to 0.5
         :type backoff_factor: float, optional
-        :param status_forcelist: _description_, defaults to (500, 502, 503, 504)
+        :param status_forcelist: Response status codes that are retried, defaults to (500, 502, 503, 504)
         :type status_forcelist: tuple, optional
-        :param session: _description_, defaults to None
-        :type session: _type_, optional
-        :return: _description_
-        :rtype: _type_
-        """
+        :param session: Session to configure, defaults to a new session
+        :type session: requests.Session, optional
+        :param allowed_methods: HTTP methods that are retried on read errors and retryable statuses, defaults to the idempotent methods. `POST` is excluded because upload bodies are streams that cannot be replayed.
+        :type allowed_methods: frozenset, optional
+        :return: The configured session
+        :rtype: requests.Session
+        """  # pylint: disable=line-too-long
         session = session or requests.Session()
         retry = Retry(
             total=retries,
@@ -185,8 +275,10 @@ class ServiceConnector:
             connect=retries,
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
+            allowed_methods=allowed_methods,
+            respect_retry_after_header=True,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=POOL_MAXSIZE)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -204,6 +296,32 @@ class ServiceConnector:
 
     ## private ##
 
+    def _get_session(self) -> requests.Session:
+        # One session per connector so consecutive requests reuse keep-alive
+        # connections instead of paying a TCP/TLS handshake each time
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = pooled_session()
+                session = self._session
+        return session
+
+    def _get_retry_session(self, retries) -> requests.Session:
+        session = self._retry_sessions.get(retries)
+        if session is None:
+            with self._session_lock:
+                session = self._retry_sessions.get(retries)
+                if session is None:
+                    session = ServiceConnector.requests_retry_session(retries=retries)
+                    self._retry_sessions[retries] = session
+        return session
+
+    @staticmethod
+    def _expires_soon(token) -> bool:
+        exp = float(decode_JWT(token)[1].get("exp", 0))
+        return exp - TOKEN_EXPIRY_MARGIN <= time.time()
+
     def _construct_url(self, uri):
         return self.urljoin([self.base_url, uri])
 
@@ -212,10 +330,14 @@ class ServiceConnector:
 
         if hasattr(self, "token") and self.token:
             self.token = verify_JWT(self.token, self._config)
+            # connectors held by service clients outlive the token they were made with,
+            # regenerate it from the PAT config before it expires
+            if self._config and self._expires_soon(self.token):
+                self.token = cached_token(self._config)
             auth = "Bearer {}".format(self.token)
             headers_to_send["Authorization"] = auth
         else:
-            self.token = generate_token(self._config)
+            self.token = cached_token(self._config)
             auth = "Bearer {}".format(self.token)
             headers_to_send["Authorization"] = auth
 
@@ -270,23 +392,23 @@ class _Client:
 
     def _post_json(self, uri, obj: JSONType):
         # pylint: disable=no-member
-        body_s = json.dumps(obj)
-        headers = {"Content-Type": "application/json"}
-        res = self._serviceconnector.request("POST", uri, body_s, headers)
+        body_s = json_dumps(obj)
+        res = self._serviceconnector.request("POST", uri, body_s, JSON_HEADERS)
         if res.status_code not in [requests.codes.ok, requests.codes.created]:
-            log.info("Status: {}, Message: {}".format(res.status_code, res.text))
+            log.info("Status: %s, Message: %s", res.status_code, res.text)
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
 
     def _post_json_with_retry(self, uri, obj: JSONType):
         # pylint: disable=no-member
-        body_s = json.dumps(obj)
-        headers = {"Content-Type": "application/json"}
-        res = self._serviceconnector.request_with_retry("POST", uri, body_s, headers)
+        body_s = json_dumps(obj)
+        res = self._serviceconnector.request_with_retry(
+            "POST", uri, body_s, JSON_HEADERS
+        )
         if res.status_code not in [requests.codes.ok, requests.codes.created]:
-            log.info("Status: {}, Message: {}".format(res.status_code, res.text))
+            log.info("Status: %s, Message: %s", res.status_code, res.text)
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
 
     def _get(self, uri, debug=False, **kwargs):
         return self._serviceconnector.request("GET", uri, debug=debug, **kwargs)
@@ -305,12 +427,12 @@ class _Client:
         if res.status_code == requests.codes.not_found:
             return None
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
 
     def _request_json(self, uri, method="GET"):
         res = self._serviceconnector.request(method, uri=uri)
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
 
     @classmethod
     def from_current_cli_profile(cls: Type[T], version: str = "3", **kwargs) -> T:
@@ -14,15 +14,19 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
-from typing import Optional, Dict, AnyStr
+import time
+from typing import Optional, Dict, AnyStr, List, Tuple, Iterator
 from .serviceconnector import _Client
 from .camel import CamelResource
 from .utils import get_logger, raise_for_status_with_detail, parse_string
+from .utils import json_dumps, json_loads, map_requests, JSON_HEADERS
 from .exceptions import SendMessageException
 
 log = get_logger(__name__)
 
+# Activation states after which polling stops
+TERMINAL_ACTIVATION_STATUSES = frozenset(("COMPLETE", "ERROR", "CANCELLED"))
+
 
 class SkillClient(_Client):
     """
@@ -30,6 +34,7 @@ class SkillClient(_Client):
     """
 
     URIs = {
+        "activation": "projects/{projectId}/activations/{activationId}",
         "deploy": "projects/{projectId}/skills/{skillName}/deploy",
         "invoke": "projects/{project}/skillinvoke/{skill_name}/inputs/{input}",
         "logs": "projects/{projectId}/skills/{skillName}/action/{actionName}/logs",
@@ -48,7 +53,7 @@ class SkillClient(_Client):
             method="GET", uri=self.URIs["skills"].format(projectId=self._project())
         )
         raise_for_status_with_detail(res)
-        rs_json = res.json()
+        rs_json = json_loads(res.content)
 
         return rs_json.get("skills", [])
 
@@ -58,14 +63,13 @@ class SkillClient(_Client):
         :param skill_obj: Skill object to save
         :return: response json
         """
-        body = json.dumps(skill_obj)
-        headers = {"Content-Type": "application/json"}
+        body = json_dumps(skill_obj)
         uri = self.URIs["skills"].format(projectId=self._project())
         res = self._serviceconnector.request(
-            method="POST", uri=uri, body=body, headers=headers
+            method="POST", uri=uri, body=body, headers=JSON_HEADERS
         )
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
 
     def get_skill(self, skill_name):
         """
@@ -79,7 +83,7 @@ class SkillClient(_Client):
         res = self._serviceconnector.request(method="GET", uri=uri)
         raise_for_status_with_detail(res)
 
-        return res.json()
+        return json_loads(res.content)
 
     def delete_skill(self, skill_name):
         """
@@ -92,7 +96,7 @@ class SkillClient(_Client):
         )
         res = self._serviceconnector.request(method="DELETE", uri=uri)
         raise_for_status_with_detail(res)
-        rs_json = res.json()
+        rs_json = json_loads(res.content)
 
         return rs_json.get("success", False)
 
@@ -111,7 +115,35 @@ class SkillClient(_Client):
         res = self._serviceconnector.request(method="GET", uri=uri)
         raise_for_status_with_detail(res)
 
-        return res.json()
+        return json_loads(res.content)
+
+    def stream_logs(
+        self, skill_name: str, action_name: str, chunk_size: int = 64 * 1024
+    ) -> Iterator[bytes]:
+        """Stream the logs of a skill action as raw chunks of the response body instead of loading them into memory at once, e.g. to write large logs straight to a file. The request is sent when iteration starts.
+
+        >>> with open("skill.log", "wb") as f:
+        ...     for chunk in client.skills.stream_logs("my-skill", "my-action"):
+        ...         f.write(chunk)
+
+        :param skill_name: Skill name
+        :type skill_name: str
+        :param action_name: Action name
+        :type action_name: str
+        :param chunk_size: Maximum size in bytes of each yielded chunk, defaults to 64 KiB
+        :type chunk_size: int, optional
+        :return: An iterator over the body of the logs response
+        :rtype: Iterator[bytes]
+        """  # pylint: disable=line-too-long
+        uri = self.URIs["logs"].format(
+            projectId=self._project(),
+            skillName=parse_string(skill_name),
+            actionName=parse_string(action_name),
+        )
+        res = self._serviceconnector.request(method="GET", uri=uri, stream=True)
+        raise_for_status_with_detail(res)
+        with res:
+            yield from res.iter_content(chunk_size=chunk_size)
 
     def deploy(self, skill_name):
         """
@@ -125,7 +157,7 @@ class SkillClient(_Client):
         res = self._serviceconnector.request(method="GET", uri=uri)
         raise_for_status_with_detail(res)
 
-        return res.json()
+        return json_loads(res.content)
 
     def undeploy(self, skill_name):
         """
@@ -138,7 +170,7 @@ class SkillClient(_Client):
         )
         res = self._serviceconnector.request(method="GET", uri=uri)
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
 
     def send_message(
         self, activation: str, channel: str, output_name: str, message: object
@@ -160,13 +192,12 @@ class SkillClient(_Client):
             channel=channel,
             output_name=output_name,
         )
-        data = json.dumps(message)
-        headers = {"Content-Type": "application/json"}
+        data = json_dumps(message)
         res = self._serviceconnector.request(
             method="POST",
             uri=uri,
             body=data,
-            headers=headers,
+            headers=JSON_HEADERS,
             debug=False,
             is_internal_url=True,
         )
@@ -174,7 +205,7 @@ class SkillClient(_Client):
             raise SendMessageException(
                 f"Send message failed {res.status_code}: {res.text}"
             )
-        return res.json()
+        return json_loads(res.content)
 
     def invoke(
         self,
@@ -202,12 +233,89 @@ class SkillClient(_Client):
         uri = self.URIs["invoke"].format(
             project=self._project(), skill_name=skill_name, input=input_name
         )
-        data = json.dumps({"payload": payload, "properties": properties})
+        data = json_dumps({"payload": payload, "properties": properties})
         params = {"sync": "true" if sync is True else "false"}
-        headers = {"Content-Type": "application/json"}
-        res = self._serviceconnector.request("POST", uri, data, headers, params=params)
+        res = self._serviceconnector.request(
+            "POST", uri, data, JSON_HEADERS, params=params
+        )
+        raise_for_status_with_detail(res)
+        return json_loads(res.content)
+
+    def invoke_many(
+        self,
+        calls: List[Tuple[str, str, object, object]],
+        sync: bool = False,
+        max_workers: int = 8,
+    ) -> List[dict]:
+        """Invoke several skills in one go. Each entry in `calls` is a `(skill_name, input_name, payload, properties)` tuple, and the results are returned in the same order as `calls`.
+
+        The invocations are submitted concurrently from a pool of up to `max_workers` threads, so the elapsed time is close to that of the slowest invocation rather than the sum of all of them. A failed invocation does not abort the remaining ones, instead its slot in the returned list holds a dictionary with the HTTP `status` and `error` message of the failure.
+
+        >>> client.skills.invoke_many([("skill-a", "input", {"text": "hi"}, {}), ("skill-b", "input", {}, {})])
+
+        :param calls: The skill invocations to perform
+        :type calls: List[Tuple[str, str, object, object]]
+        :param sync: Set this to True if you want synchronous skill invokes
+        :type sync: bool
+        :param max_workers: Maximum number of invocations in flight at once, defaults to 8
+        :type max_workers: int, optional
+        :return: One response (or error) dictionary per entry in `calls`
+        :rtype: List[dict]
+        """  # pylint: disable=line-too-long
+        return map_requests(
+            lambda call: self.invoke(*call, sync=sync), calls, max_workers
+        )
+
+    def get_activation(self, activation_id: str) -> dict:
+        """Fetch the current state of a skill activation, e.g. one returned by :meth:`invoke` with `sync=False`
+
+        :param activation_id: ID of the activation
+        :type activation_id: str
+        :return: The activation details, including its `status`
+        :rtype: dict
+        """  # pylint: disable=line-too-long
+        uri = self.URIs["activation"].format(
+            projectId=self._project(), activationId=parse_string(activation_id)
+        )
+        res = self._serviceconnector.request(method="GET", uri=uri)
         raise_for_status_with_detail(res)
-        return res.json()
+        return json_loads(res.content)
+
+    def wait_for_activation(self, activation_id: str, timeout: float = 30) -> dict:
+        """Poll an activation until it reaches a terminal status (`COMPLETE`, `ERROR` or `CANCELLED`) or `timeout` seconds have elapsed.
+
+        Polling starts 50ms apart and backs off exponentially up to one request per second, so short activations are picked up quickly without hammering the server on long ones. When the server returns an `ETag`, later polls are conditional and an unchanged activation costs a body-less `304 Not Modified` response instead of a full download and parse.
+
+        :param activation_id: ID of the activation
+        :type activation_id: str
+        :param timeout: Maximum number of seconds to wait, defaults to 30
+        :type timeout: float, optional
+        :return: The last fetched activation details, check its `status` to tell whether it finished before the timeout
+        :rtype: dict
+        """  # pylint: disable=line-too-long
+        uri = self.URIs["activation"].format(
+            projectId=self._project(), activationId=parse_string(activation_id)
+        )
+        headers = None
+        activation = None
+        end = time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            res = self._serviceconnector.request(method="GET", uri=uri, headers=headers)
+            raise_for_status_with_detail(res)
+            # 304 Not Modified: the activation is unchanged since the previous poll
+            if res.status_code != 304 or activation is None:
+                activation = json_loads(res.content)
+                etag = res.headers.get("ETag")
+                headers = {"If-None-Match": etag} if etag else None
+            remaining = end - time.monotonic()
+            if (
+                activation.get("status") in TERMINAL_ACTIVATION_STATUSES
+                or remaining <= 0
+            ):
+                return activation
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
 
     @property
     def project(self) -> AnyStr:
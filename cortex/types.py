@@ -50,7 +50,7 @@ class TypeClient(_Client):
         uri = self.URIs["type"].format(
             projectId=self._project(), name=urllib.parse.quote(name, safe="")
         )
-        log.debug("Getting type using URI: {}", uri)
+        log.debug("Getting type using URI: %s", uri)
         res = self._serviceconnector.request("GET", uri=uri)
         raise_for_status_with_detail(res)
         return Type(res.json(), self)
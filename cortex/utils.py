@@ -16,13 +16,18 @@ limitations under the License.
 
 import json
 import base64
+import functools
 import hashlib
 import logging
+import re
+import threading
+import time
 import urllib.parse
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Union
+from typing import Callable, Iterable, List, Union
 
 import python_jwt as py_jwt
 import jwcrypto.jwk as jwkLib
@@ -30,6 +35,15 @@ from requests.exceptions import HTTPError
 from requests import request
 from .exceptions import BadTokenException, AuthenticationHeaderError
 
+try:
+    import orjson  # pylint: disable=import-error
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Shared request headers for JSON bodies. Callers pass this dict as is, never mutate it;
+# ServiceConnector copies it into the headers it sends.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def md5sum(file_name, blocksize=65536):
     """
@@ -114,21 +128,51 @@ def decode_JWT(*args) -> tuple:
     # pylint: disable=invalid-name
     """
     thin wrapper around jwt.decode. This function exists for better error handling of the
-    jwt exceptions.
+    jwt exceptions. Decoding a single token string is cached, as the same token is decoded
+    again before every request made with it. Only the header and claims are parsed, the
+    signature is never verified here; the Cortex services verify it on every request.
     """
+    if len(args) == 1 and isinstance(args[0], str):
+        return _decode_JWT_cached(args[0])
+    return _decode_JWT(py_jwt.process_jwt, *args)
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_JWT_cached(token: str) -> tuple:
+    # pylint: disable=invalid-name
+    # exceptions are not cached, so an invalid token is rejected on every call
+    return _decode_JWT(_process_jwt, token)
+
+
+def _decode_JWT(process, *args) -> tuple:
+    # pylint: disable=invalid-name
     invalid_token_msg = "Your Cortex Token is invalid: "
     try:
-        (_, payload) = decodedJWT = py_jwt.process_jwt(*args)
+        (_, payload) = decodedJWT = process(*args)
         # there are places in the sdk where we try to decode 'any ol token' before sending the token
         # to auth to get verified therefore, here we have some reasonable checks to make sure that
         # this is a cortex token by checking the JWT keys exist
         if not payload.get("aud") or not payload.get("sub") or not payload.get("exp"):
             raise BadTokenException(invalid_token_msg)
         return decodedJWT
-    except py_jwt._JWTError as err:  # pylint: disable=protected-access
+    except (py_jwt._JWTError, ValueError) as err:  # pylint: disable=protected-access
         raise BadTokenException(invalid_token_msg.format(err)) from err
 
 
+def _process_jwt(token: str) -> tuple:
+    # Same (header, claims) result as python_jwt.process_jwt, but parses the two JSON
+    # segments with json_loads, i.e. orjson when it is installed. Malformed tokens
+    # raise ValueError.
+    header, claims, _ = token.split(".")
+    return _b64url_json(header), _b64url_json(claims)
+
+
+def _b64url_json(segment: str):
+    return json_loads(
+        base64.b64decode(segment + "=" * (-len(segment) % 4), b"-_", validate=True)
+    )
+
+
 def verify_JWT(token, config=None):
     # pylint: disable=invalid-name
     """
@@ -144,14 +188,23 @@ def verify_JWT(token, config=None):
 
 def _get_fabric_info(config: dict, verify_ssl_cert: Union[bool, str]=True):
     uri = config.get("url") + "/fabric/v4/info"
-    headers = {"Content-Type": "application/json"}
-    return request("GET", uri, headers=headers, verify=verify_ssl_cert,).json()
+    return json_loads(
+        request("GET", uri, headers=JSON_HEADERS, verify=verify_ssl_cert).content
+    )
 
 
 def _get_fabric_server_ts(config: dict, verify_ssl_cert: Union[bool, str]=True):
     return _get_fabric_info(config, verify_ssl_cert).get("serverTs")
 
 
+@functools.lru_cache(maxsize=16)
+def _load_jwk(jwk_json: str) -> tuple:
+    # A PAT config keeps the same key for the life of the process, so the key is
+    # parsed and its thumbprint computed once rather than on every token generated
+    key = jwkLib.JWK.from_json(jwk_json)
+    return key, key.thumbprint()
+
+
 def generate_token(config, verify_ssl_cert: Union[bool, str]=True, validity=2):
     """
     Use the Personal Access Token (JWK) obtained from Cortex's console
@@ -165,7 +218,7 @@ def generate_token(config, verify_ssl_cert: Union[bool, str]=True, validity=2):
         server_ts = int(
             _get_fabric_server_ts(config, verify_ssl_cert) / 1000
         )  # fabric info returns serverTs in milliseconds
-        key = jwkLib.JWK.from_json(json.dumps(config.get("jwk")))
+        key, kid = _load_jwk(json.dumps(config.get("jwk"), sort_keys=True))
         token_payload = {
             "iss": config.get("issuer"),
             "aud": config.get("audience"),
@@ -183,7 +236,7 @@ def generate_token(config, verify_ssl_cert: Union[bool, str]=True, validity=2):
             algorithm="EdDSA",
             expires=expiry,
             other_headers={
-                "kid": key.thumbprint(),
+                "kid": kid,
             },
         )
         return token
@@ -194,6 +247,32 @@ def generate_token(config, verify_ssl_cert: Union[bool, str]=True, validity=2):
         raise BadTokenException(gen_token_msg) from err
 
 
+# (config fingerprint, validity) -> (token, time after which it is regenerated)
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def cached_token(config: dict, validity=2) -> str:
+    """
+    Returns a JWT generated from `config` by :func:`generate_token`. Tokens are shared process wide per `config` and `validity`, and reused for as long as at least half of their validity remains. Concurrent callers missing the cache wait for a single token to be generated instead of each generating one.
+    """  # pylint: disable=line-too-long
+    key = (
+        hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest(),
+        validity,
+    )
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None and time.time() < cached[1]:
+        return cached[0]
+    with _TOKEN_CACHE_LOCK:
+        # another thread may have generated the token while this one waited for the lock
+        cached = _TOKEN_CACHE.get(key)
+        if cached is not None and time.time() < cached[1]:
+            return cached[0]
+        token = generate_token(config, validity=validity)
+        _TOKEN_CACHE[key] = (token, time.time() + validity * 30)
+    return token
+
+
 def get_cortex_profile(profile_name=None):
     """
     Gets the current cortex profile or the profile that matches the optional given name.
@@ -201,15 +280,33 @@ def get_cortex_profile(profile_name=None):
 
     cortex_config_path = Path.home() / ".cortex" / "config"
 
-    if cortex_config_path.exists():
-        with cortex_config_path.open() as filed:
-            cortex_config = json.load(filed)
+    cortex_config = _read_cortex_config(cortex_config_path)
+    if cortex_config is None:
+        return {}
 
-        if profile_name is None:
-            profile_name = cortex_config.get("currentProfile")
+    if profile_name is None:
+        profile_name = cortex_config.get("currentProfile")
 
-        return cortex_config.get("profiles", {}).get(profile_name, {})
-    return {}
+    return dict(cortex_config.get("profiles", {}).get(profile_name, {}))
+
+
+# config file path -> (modification time, parsed contents)
+_CORTEX_CONFIG_CACHE = {}
+
+
+def _read_cortex_config(path: Path) -> Union[dict, None]:
+    # The CLI config is re-read only when the file changes, so creating clients
+    # repeatedly costs a stat() instead of an open and a JSON parse every time
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _CORTEX_CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        with path.open() as filed:
+            cached = (mtime, json.load(filed))
+        _CORTEX_CONFIG_CACHE[path] = cached
+    return cached[1]
 
 
 def get_logger(name):
@@ -237,6 +334,36 @@ def json_str(val):
         return str(val)
 
 
+def json_dumps(obj) -> Union[str, bytes]:
+    """
+    Serializes `obj` to JSON for use as a request body. Uses `orjson` when it is installed (`pip install cortex-python[speedups]`), falling back to the standard library otherwise.
+    """  # pylint: disable=line-too-long
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects a few values json accepts, e.g. ints wider than 64 bits
+            pass
+    return json.dumps(obj)
+
+
+# A run of 19 or more digits may be an integer outside the 64 bit range orjson parses
+# exactly, it would silently turn it into a float
+_WIDE_NUMBER = re.compile(r"\d{19}")
+_WIDE_NUMBER_BYTES = re.compile(rb"\d{19}")
+
+
+def json_loads(data: Union[str, bytes]):
+    """
+    Deserializes a JSON document, e.g. the `content` of a response. Uses `orjson` when it is installed, except for documents that may hold integers wider than 64 bits, which the standard library keeps exact.
+    """  # pylint: disable=line-too-long
+    if orjson is not None:
+        wide = _WIDE_NUMBER if isinstance(data, str) else _WIDE_NUMBER_BYTES
+        if not wide.search(data):
+            return orjson.loads(data)
+    return json.loads(data)
+
+
 def base64decode_jsonstring(base64encoded_jsonstring: str):
     """
     Loads a json from a base64 encoded json string.
@@ -270,11 +397,41 @@ def raise_for_status_with_detail(resp):
         )
 
 
+def map_requests(func: Callable, items: Iterable, max_workers: int = 8) -> List:
+    """
+    call `func` on every item from a pool of up to `max_workers` threads
+    a failed HTTP request does not abort the remaining calls, its slot holds
+    a dict with the HTTP `status` and `error` message of the failure
+    :param func: function making one request per item
+    :param items: the arguments to call `func` with
+    :param max_workers: maximum number of calls in flight at once
+    :return: the results, in the order of `items`
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        try:
+            return func(item)
+        except HTTPError as err:
+            return {"status": err.response.status_code, "error": err.response.text}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(call, items))
+
+
 def parse_string(string: str):
     """
     parse a given string and apply common encoding/substitution rules
     :param string: the string to parse
     :return:
     """
-    # Replaces special characters like / with %2F (URL encoding)
+    # Replaces special characters like / with %2F (URL encoding). Names made only of
+    # characters quote() never escapes, the usual case, are returned as they are.
+    if isinstance(string, str) and _URL_UNRESERVED(string):
+        return string
     return urllib.parse.quote(string, safe="")
+
+
+_URL_UNRESERVED = re.compile(r"[A-Za-z0-9_.~-]*").fullmatch
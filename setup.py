@@ -56,6 +56,7 @@ setup(
     extras_require={
         "viz": ["matplotlib>=2.2.2,<3", "seaborn>=0.9.0,<0.10", "pandas"],
         "jupyter": ["ipython>=6.4.0,<7", "maya>=0.5.0", "jinja2"],
+        "speedups": ["orjson>=3.8.0"],
     },
     tests_require=["requests-mock>=1.10.0", "pytest>=7.2.1,<8"],
     classifiers=[
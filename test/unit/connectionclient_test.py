@@ -15,7 +15,11 @@ limitations under the License.
 """
 
 from io import BytesIO, StringIO
+import os
+import tempfile
+import time
 import unittest
+from urllib.parse import urlparse
 import requests_mock
 
 from cortex.connection import ConnectionClient
@@ -47,6 +51,105 @@ class TestConnectionClient(unittest.TestCase):
         m.post(url, status_code=200, json=connection)
         r = self.cc.save_connection(connection=connection)
         self.assertEqual(r, connection)
+        self.assertEqual(m.last_request.json(), connection)
+
+    def test_save_connection_keeps_wide_integers(self, m):
+        uri = self.cc.URIs["connections"].format(projectId=projectId)
+        url = self.cc._serviceconnector._construct_url(uri)
+        m.post(url, status_code=200, text='{"size": 123456789012345678901234567890}')
+        r = self.cc.save_connection(connection={"name": "cname"})
+        self.assertEqual(r, {"size": 123456789012345678901234567890})
+
+    def test_save_connections(self, m):
+        uri = self.cc.URIs["connections"].format(projectId=projectId)
+        url = self.cc._serviceconnector._construct_url(uri)
+
+        def respond(request, context):
+            body = request.json()
+            if body["name"] == "bad":
+                context.status_code = 400
+                return {"message": "invalid connection"}
+            return body
+
+        m.post(url, json=respond)
+        r = self.cc.save_connections(
+            [{"name": "a"}, {"name": "bad"}, {"name": "c"}], max_workers=2
+        )
+        self.assertEqual(r[0], {"name": "a"})
+        self.assertEqual(r[1]["status"], 400)
+        self.assertIn("invalid connection", r[1]["error"])
+        self.assertEqual(r[2], {"name": "c"})
+        self.assertEqual(self.cc.save_connections([]), [])
+
+    def test_save_connections_keeps_order_around_failure(self, m):
+        uri = self.cc.URIs["connections"].format(projectId=projectId)
+        url = self.cc._serviceconnector._construct_url(uri)
+        names = [f"c{i}" for i in range(6)]
+
+        def respond(request, context):
+            body = request.json()
+            index = names.index(body["name"])
+            # earlier saves finish last, so completion order is the reverse of input order
+            time.sleep(0.01 * (len(names) - index))
+            if index == 3:
+                context.status_code = 500
+                return {"message": "failed"}
+            return body
+
+        m.post(url, json=respond)
+        r = self.cc.save_connections([{"name": name} for name in names], max_workers=6)
+        self.assertEqual(r[3]["status"], 500)
+        self.assertEqual(
+            [x["name"] for i, x in enumerate(r) if i != 3],
+            [name for i, name in enumerate(names) if i != 3],
+        )
+
+    def test_get_connection(self, m):
+        cc = ConnectionClient("http://cortex-internal", token=TOKEN, project=projectId)
+        conn_url = f"http://cortex-connections:4450/internal/projects/{projectId}/connections/my%20conn"
+        m.get(conn_url, status_code=200, json={"name": "my conn"})
+        self.assertEqual(cc.get_connection("my conn"), {"name": "my conn"})
+        self.assertEqual(cc.get_connection("my conn"), {"name": "my conn"})
+        self.assertEqual(m.call_count, 2)
+
+    def test_bootstrap(self, m):
+        uri = self.cc.URIs["bootstrap"].format(projectId=projectId)
+        url = self.cc._serviceconnector._construct_url(uri)
+        m.get(url, status_code=200, json={"types": []})
+        self.assertEqual(self.cc._bootstrap(), {"types": []})
+
+    def test_upload_directory(self, m):
+        uri = self.mc.URIs["content"].format(projectId=projectId)
+        prefix = self.mc._serviceconnector._construct_url(uri)
+        m.post(
+            requests_mock.ANY,
+            json=lambda request, context: {"path": request.path},
+        )
+        with tempfile.TemporaryDirectory() as source:
+            os.makedirs(os.path.join(source, "sub"))
+            for name in ("a.txt", "b.txt", os.path.join("sub", "c.txt")):
+                with open(os.path.join(source, name), "w") as f:
+                    f.write(name)
+            found = [
+                relative
+                for _, relative in ManagedContentClient._get_source_files(source + "/")
+            ]
+            res = self.mc.upload_directory(source, "dest", max_workers=2)
+        self.assertEqual(len(res), 3)
+        self.assertEqual(m.call_count, 3)
+        expected = [urlparse(f"{prefix}/dest/{name}").path.lower() for name in found]
+        self.assertEqual([r["path"] for r in res], expected)
+
+    def test_upload_directory_missing_or_file_source(self, m):
+        with tempfile.TemporaryDirectory() as source:
+            path = os.path.join(source, "a.txt")
+            with open(path, "w") as f:
+                f.write("a")
+            self.assertEqual(self.mc.upload_directory(path, "dest"), [])
+            self.assertEqual(
+                self.mc.upload_directory(os.path.join(source, "missing"), "dest"), []
+            )
+        self.assertEqual(m.call_count, 0)
 
     def test_upload(self, m):
         key = "some-key"
@@ -16,11 +16,11 @@ limitations under the License.
 
 import unittest
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import requests_mock
 
-from cortex.client import Cortex
+from cortex.client import Client, Cortex, _Token
 from cortex.message import Message
 import pytest
 from cortex.connection import ConnectionClient, Connection
@@ -53,6 +53,55 @@ class TestCortex(unittest.TestCase):
         assert cortex._url == api_endpoint
         assert cortex._token._token == token
         assert cortex._token._jwt[1]["sub"] == john_doe_subject()
+        assert cortex._token._exp == cortex._token._jwt[1]["exp"]
+        assert not cortex._token.is_expired()
+
+    def test_service_clients_share_session(self):
+        cortex = Cortex.client(
+            api_endpoint=api_endpoint,
+            api_version=api_version,
+            project="unittest",
+            token=token,
+        )
+        skills = cortex.skills._serviceconnector
+        models = cortex.models._serviceconnector
+        assert skills._get_session() is models._get_session()
+        skills.close()
+        assert models._get_session() is cortex._session
+        assert skills._get_session() is cortex._session
+        cortex.close()
+        assert skills._get_session() is cortex._session
+
+    def test_close_closes_service_client_retry_sessions(self):
+        cortex = Client(url=api_endpoint, token=_Token(token), project="unittest")
+        connector = cortex.content._serviceconnector
+        retry_session = connector._get_retry_session(1)
+        with patch.object(retry_session, "close") as close:
+            cortex.close()
+        close.assert_called_once_with()
+        assert connector._retry_sessions == {}
+
+    def test_service_clients_created_on_first_access(self):
+        cortex = Client(url=api_endpoint, token=_Token(token), project="unittest")
+        assert cortex._service_clients == {}
+        skills = cortex.skills
+        assert isinstance(skills, SkillClient)
+        assert cortex.skills is skills
+        assert list(cortex._service_clients) == ["skills"]
+
+    def test_project_clients_reuse_client_connection(self):
+        cortex = Cortex.client(
+            api_endpoint=api_endpoint,
+            api_version=api_version,
+            project="unittest",
+            token=token,
+        )
+        connector = cortex.skills_client(project="other")._serviceconnector
+        assert connector.project == "other"
+        assert connector.url == api_endpoint
+        assert connector._get_session() is cortex._session
+        assert cortex.skills._project() == "unittest"
+        assert cortex.skills_client(project="unittest") is cortex.skills
 
     def test_message_creation(self):
         cortex = Cortex.client(
@@ -85,6 +134,50 @@ class TestCortex(unittest.TestCase):
         assert client._url == api_endpoint
         assert client._token.token == token
 
+    def test_client_is_reused_for_same_arguments(self):
+        args = dict(api_endpoint=api_endpoint, api_version=api_version, token=token)
+        client = Cortex.client(project="reused", **args)
+        assert Cortex.client(project="reused", **args) is client
+        assert Cortex.client(project="other", **args) is not client
+
+    def test_evicted_client_is_not_returned(self):
+        args = dict(api_endpoint=api_endpoint, api_version=api_version, token=token)
+        with patch("cortex.client._CLIENT_CACHE_SIZE", 1):
+            first = Cortex.client(project="evicted", **args)
+            with patch.object(first._session, "close") as close:
+                kept = Cortex.client(project="kept", **args)
+            close.assert_not_called()
+            assert Cortex.client(project="kept", **args) is kept
+            assert Cortex.client(project="evicted", **args) is not first
+
+    def test_messages(self):
+        cortex = Cortex.client(
+            api_endpoint=api_endpoint,
+            api_version=api_version,
+            project="unittest",
+            token=token,
+        )
+        messages = cortex.messages([{"n": 1}, {"n": 2}], properties={"p": "v"})
+        assert [m.payload for m in messages] == [{"n": 1}, {"n": 2}]
+        assert all(m.token == token and m.apiEndpoint == api_endpoint for m in messages)
+        assert messages[1].properties == {"p": "v"}
+        assert cortex.messages([]) == []
+
+    def test_message_regenerates_expired_token(self):
+        expired = (
+            "eyJhbGciOiJFZERTQSIsImtpZCI6IkhwVy15YTdGU1U3eVYtYWx6eWV3UFBEd1BlRmdya2kwVlFQS2JoNEo0UHciLCJ0eXAiOiJKV1QifQ."
+            "eyJhdWQiOiJjb3J0ZXgiLCJleHAiOjE2MzAzNDgxOTYsImlhdCI6MTYzMDM0ODE2NiwiaXNzIjoiY29nbml0aXZlc2NhbGUuY29tIiwianRpIjoiU0dkRjVidG1fUXlYcjZhMVRrOU9oZyIsIm5iZiI6MTYzMDM0ODE2Niwic3ViIjoiNzFhOGZhYWMtOWRmYi00MjhkLWE5MGMtMGI1MzQ4MWI4NjY1In0."
+            "pB7hvEcIMV1Qt6GTGPGcKbS1zhidPMJ-luV-KBOaHrwgCh2jDOQdve2Sv5RqmNa6Jkk-Bxh-1g4XG8CxGGSqAQ"
+        )
+        with patch("cortex.client.cached_token", return_value=token) as gen:
+            client = Client(
+                url=api_endpoint, token=_Token(expired), config={"k": "v"}, project="p"
+            )
+            message = client.message({"foo": "bar"})
+        assert message.token == token
+        assert not client._token.is_expired()
+        gen.assert_called_with({"k": "v"})
+
     # Check message format
     def test_client_fromMessage_errs(self):
         messages = [
@@ -99,6 +192,8 @@ class TestCortex(unittest.TestCase):
         for message in messages:
             with pytest.raises(Exception, match="Skill message"):
                 Cortex.from_message(message)
+        with pytest.raises(Exception, match=r"missing: \['projectId'\]"):
+            Cortex.from_message({"apiEndpoint": api_endpoint, "token": token})
 
     def test_proj_override(self):
         project = "clientProj"
@@ -212,6 +307,7 @@ class TestCortex(unittest.TestCase):
         for client_inst, project, fun_name, fun_args in tests:
             print(f"Testing project {type(client_inst)}.{fun_name} with {project}")
             mock = Mock()
+            mock.return_value.content = b"{}"
             client_inst._serviceconnector.request = mock
             func = getattr(client_inst, fun_name)
             if fun_args is None:
@@ -109,6 +109,12 @@ class TestCortexConfiguration(unittest.TestCase):
         CortexEnv.get_cortex_profile = Mock(return_value=profile)
         self.assertRaises(BadTokenException, CortexEnv)
 
+    def test_constructor_skips_profile_when_config_given(self):
+        CortexEnv.get_cortex_profile = Mock(return_value={})
+        env = CortexEnv(config={"url": "https://api.example.com", "project": "p"})
+        self.assertEqual(env.api_endpoint, "https://api.example.com")
+        CortexEnv.get_cortex_profile.assert_not_called()
+
     # we don't want methods calls to CortexEnv to use the monkey patched methods,
     # so we revert to the original methods.
     def tearDown(self):
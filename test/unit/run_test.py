@@ -14,7 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
 import unittest
+from urllib.parse import parse_qs, urlparse
 
 import dill
 import requests_mock
@@ -124,6 +126,23 @@ class TestRun(unittest.TestCase):
         with raises(HTTPError) as ex:
             ret = self.cortex.experiments.get_run(self.RUN_EXP_NAME, self.RUN_ID)
 
+    def test_get_runs(self, m):
+        uri = self.cortex.experiments.URIs["runs"].format(
+            experimentName=self.RUN_EXP_NAME, projectId=PROJECT
+        )
+        returns = {"runs": [{"runId": "run_01"}, {"runId": "run_02"}]}
+        m.get(build_mock_url(uri), status_code=200, json=returns)
+
+        ret = self.cortex.experiments.get_runs(
+            self.RUN_EXP_NAME, ["run_01", "run_02", "run_01"]
+        )
+        self.assertEqual(ret, {"run_01": {"runId": "run_01"}, "run_02": {"runId": "run_02"}})
+        self.assertEqual(m.call_count, 1)
+        query = parse_qs(urlparse(m.last_request.url).query)
+        self.assertEqual(
+            json.loads(query["filter"][0]), {"runId": {"$in": ["run_01", "run_02"]}}
+        )
+
     def test_run_get_artifact(self, m):
         self.registerMocks(m);
         exp = Experiment(
@@ -15,11 +15,15 @@ limitations under the License.
 """
 
 import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import requests
 import requests_mock
 
 from cortex.__version__ import __version__
-from cortex.serviceconnector import ServiceConnector
+from cortex.serviceconnector import ServiceConnector, _token_expiry_margin
 
 from .fixtures import mock_api_endpoint, john_doe_token
 
@@ -55,3 +59,70 @@ def test_request(**kwargs):
     assert r.status_code == 200
     assert r.json() == body
     assert useragentfragment in r.request.headers["user-agent"]
+
+
+@requests_mock.Mocker(kw='mock')
+def test_request_reuses_session(**kwargs):
+    sc = ServiceConnector(URL, VERSION, token=TOKEN)
+    path = "models/events"
+    kwargs['mock'].get(sc._construct_url(path), status_code=200, json={})
+    sc.request("GET", path)
+    session = sc._session
+    sc.request("GET", path)
+
+    assert session is not None
+    assert sc._session is session
+    sc.close()
+    assert sc._session is None
+
+
+def test_retry_session_retries_idempotent_methods_only():
+    session = ServiceConnector.requests_retry_session(retries=3)
+    retry = session.get_adapter("https://example.com").max_retries
+
+    assert retry.total == 3
+    assert retry.respect_retry_after_header
+    assert "GET" in retry.allowed_methods
+    assert "POST" not in retry.allowed_methods
+
+
+def test_token_expiry_margin_from_env():
+    for value, expected in [("45", 45.0), ("0", 0.0), ("abc", 30.0), ("-5", 30.0)]:
+        with patch.dict("os.environ", {"CORTEX_TOKEN_SKEW": value}):
+            assert _token_expiry_margin() == expected
+    with patch.dict("os.environ", clear=True):
+        assert _token_expiry_margin() == 30.0
+
+
+def test_construct_headers_regenerates_expiring_token():
+    with_config = ServiceConnector(URL, VERSION, token=TOKEN, config={"k": "v"})
+    without_config = ServiceConnector(URL, VERSION, token=TOKEN)
+    with patch("cortex.serviceconnector.cached_token", return_value="fresh") as gen:
+        # long after the fixture token has expired
+        with patch("cortex.serviceconnector.time.time", return_value=4102444800):
+            headers = with_config._construct_headers(None)
+            assert without_config._construct_headers(None)["Authorization"] == f"Bearer {TOKEN}"
+    assert headers["Authorization"] == "Bearer fresh"
+    assert with_config.token == "fresh"
+    gen.assert_called_once_with({"k": "v"})
+
+
+def test_retry_session_created_once_across_threads():
+    sc = ServiceConnector(URL, VERSION, token=TOKEN)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        sessions = list(pool.map(lambda _: sc._get_retry_session(2), range(16)))
+    assert all(session is sessions[0] for session in sessions)
+    assert list(sc._retry_sessions) == [2]
+    sc.close()
+    assert sc._retry_sessions == {}
+
+
+def test_pickle_round_trip():
+    sc = ServiceConnector(URL, VERSION, token=TOKEN, project="p")
+    sc._get_session()
+    sc._get_retry_session(2)
+    copy = pickle.loads(pickle.dumps(sc))
+    assert (copy.url, copy.token, copy.project) == (URL, TOKEN, "p")
+    assert copy._session is None and copy._retry_sessions == {}
+    assert copy._get_retry_session(2) is copy._get_retry_session(2)
+    assert copy._get_session() is not sc._session
@@ -0,0 +1,112 @@
+"""
+Copyright 2023 Cognitive Scale, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+import requests_mock
+
+from cortex.skill import SkillClient
+from cortex.client import Cortex
+
+from .fixtures import john_doe_token, mock_api_endpoint, mock_project
+
+projectId = mock_project()
+url = mock_api_endpoint()
+
+TOKEN=''
+with requests_mock.Mocker() as m:
+    TOKEN = john_doe_token(m)
+
+
+@requests_mock.Mocker()
+class TestSkillClient(unittest.TestCase):
+    def setUp(self):
+        params = {"token": TOKEN, "projectId": projectId, "apiEndpoint": url}
+        self.client = SkillClient(Cortex.from_message(params))
+
+    def register_invoke(self, m, skill_name, status_code, body):
+        uri = self.client.URIs["invoke"].format(
+            project=projectId, skill_name=skill_name, input="input"
+        )
+        url = self.client._serviceconnector._construct_url(uri)
+        m.register_uri("POST", url, status_code=status_code, json=body)
+
+    def test_invoke_many(self, m):
+        self.register_invoke(m, "skill-a", 200, {"activationId": "a"})
+        self.register_invoke(m, "skill-b", 200, {"activationId": "b"})
+        r = self.client.invoke_many(
+            [
+                ("skill-a", "input", {"text": "a"}, {}),
+                ("skill-b", "input", {"text": "b"}, {}),
+            ]
+        )
+        self.assertEqual(r, [{"activationId": "a"}, {"activationId": "b"}])
+
+    def test_invoke_many_keeps_errors(self, m):
+        self.register_invoke(m, "skill-a", 404, {"message": "not found"})
+        self.register_invoke(m, "skill-b", 200, {"activationId": "b"})
+        r = self.client.invoke_many(
+            [
+                ("skill-a", "input", {}, {}),
+                ("skill-b", "input", {}, {}),
+            ]
+        )
+        self.assertEqual(r[0]["status"], 404)
+        self.assertIn("not found", r[0]["error"])
+        self.assertEqual(r[1], {"activationId": "b"})
+
+    def test_wait_for_activation(self, m):
+        uri = self.client.URIs["activation"].format(
+            projectId=projectId, activationId="act-1"
+        )
+        url = self.client._serviceconnector._construct_url(uri)
+        m.get(
+            url,
+            [
+                {"status_code": 200, "json": {"status": "PENDING"}},
+                {"status_code": 200, "json": {"status": "COMPLETE", "response": {}}},
+            ],
+        )
+        r = self.client.wait_for_activation("act-1", timeout=5)
+        self.assertEqual(r["status"], "COMPLETE")
+        self.assertEqual(m.call_count, 2)
+
+    def test_stream_logs(self, m):
+        uri = self.client.URIs["logs"].format(
+            projectId=projectId, skillName="skill-a", actionName="action"
+        )
+        url = self.client._serviceconnector._construct_url(uri)
+        m.get(url, status_code=200, content=b'{"success":true,"logs":"line1"}')
+        chunks = list(self.client.stream_logs("skill-a", "action", chunk_size=8))
+        self.assertEqual(b"".join(chunks), b'{"success":true,"logs":"line1"}')
+        self.assertTrue(all(len(chunk) <= 8 for chunk in chunks))
+
+    def test_wait_for_activation_not_modified(self, m):
+        uri = self.client.URIs["activation"].format(
+            projectId=projectId, activationId="act-1"
+        )
+        url = self.client._serviceconnector._construct_url(uri)
+        m.get(
+            url,
+            [
+                {"status_code": 200, "json": {"status": "PENDING"}, "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+                {"status_code": 200, "json": {"status": "COMPLETE"}, "headers": {"ETag": '"v2"'}},
+            ],
+        )
+        r = self.client.wait_for_activation("act-1", timeout=5)
+        self.assertEqual(r["status"], "COMPLETE")
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(m.request_history[1].headers["If-None-Match"], '"v1"')